@@ -25,6 +25,7 @@ setup(
     license="MIT",
     keywords="static constant model enum django",
     url="https://github.com/wsmith323/staticmodel",
+    python_requires='>=3.7',
     classifiers=[
             # How mature is this project? Common values are
             #   3 - Alpha
@@ -41,9 +42,6 @@ setup(
             # Specify the Python versions you support here. In particular, ensure
             # that you indicate whether you support Python 2, Python 3 or both.
             'Programming Language :: Python :: 3',
-            'Programming Language :: Python :: 3.4',
-            'Programming Language :: Python :: 3.5',
-            'Programming Language :: Python :: 3.6',
             'Programming Language :: Python :: 3.7',
             'Programming Language :: Python :: 3.8',
             'Programming Language :: Python :: 3.9',
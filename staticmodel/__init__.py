@@ -1208,8 +1208,31 @@ to a single field name.
   "Likes to eat"
 ]
 """
-from .core import StaticModel
-
-import os
-with open(os.path.join(os.path.dirname(__file__), 'VERSION.txt')) as f:
-    __version__ = f.read().strip()
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import StaticModel
+
+__all__ = ('StaticModel', '__version__')
+
+
+def __getattr__(name):
+    # Both the model machinery and the version are loaded on first
+    # access, then memoized in the module globals, which keeps the
+    # import itself free of file I/O and of the core module.
+    if name == 'StaticModel':
+        from .core import StaticModel
+        globals()[name] = StaticModel
+        return StaticModel
+    if name == '__version__':
+        import os
+        with open(os.path.join(os.path.dirname(__file__), 'VERSION.txt')) as f:
+            version = f.read().strip()
+        globals()[name] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    # The lazily loaded attributes are listed before they are loaded.
+    return sorted(set(globals()) | set(__all__))
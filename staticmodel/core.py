@@ -1,7 +1,9 @@
 from collections import OrderedDict
-from collections.abc import Iterable
-from functools import partialmethod
+from functools import lru_cache
 from itertools import chain
+from operator import attrgetter, is_, itemgetter
+from sys import intern
+from threading import RLock
 from types import SimpleNamespace
 
 from .util import format_kwargs
@@ -10,22 +12,32 @@ from .util import format_kwargs
 class AttrName:
     class CLASS:
         FIELD_NAMES = '_field_names'
+        FIELD_NAME_SET = '_field_name_set'
+        RAW_MEMBERS = '_StaticModelMeta__raw_members'
 
     class INSTANCE:
         MEMBER_NAME = '_member_name'
         RAW_VALUE = '_raw_value'
+        FIELD_VALUES = '_field_values'
+        REPR = '_repr'
 
 
-class StaticModelMeta(type):
-    @classmethod
-    def __prepare__(mcs, name, bases, **kwargs):
-        return OrderedDict()
+_interned_field_names = {}
+_missing = object()
+# Guards the registration of members against concurrent index builds.
+_index_lock = RLock()
+
+# Maximum number of .filter() and .members.get() results, and of
+# .members.choices() results, kept per model.
+_QUERY_CACHE_SIZE = 256
 
+
+class StaticModelMeta(type):
     def __new__(mcs, name, bases, attrs, **kwargs):
 
         # Extract members into _raw_members dict before class is
         # created.
-        raw_members = OrderedDict()
+        raw_members = {}
         for attr_name in tuple(attrs.keys()):
             if attr_name.startswith('_'):
                 continue
@@ -35,29 +47,53 @@ class StaticModelMeta(type):
             raw_members[attr_name] = attrs[attr_name]
             del attrs[attr_name]
 
-        attrs['_{}__raw_members'.format(name)] = raw_members
+        attrs[AttrName.CLASS.RAW_MEMBERS] = raw_members
+
+        # Field names are frozen once, so that members can be built
+        # and rendered against the same tuple, which is shared by models
+        # with the same field names. The set is for membership checks.
+        if AttrName.CLASS.FIELD_NAMES in attrs:
+            field_names = _freeze_field_names(attrs[AttrName.CLASS.FIELD_NAMES])
+            attrs[AttrName.CLASS.FIELD_NAMES] = field_names
+            attrs[AttrName.CLASS.FIELD_NAME_SET] = frozenset(field_names)
 
         return super().__new__(mcs, name, bases, attrs)
 
     def __init__(cls, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        cls._submodels = OrderedDict()
+        cls._submodels = {}
         cls._members = SimpleNamespace(
-            by_id=OrderedDict(), by_member_name=OrderedDict())
-        cls._indexes = {}
+            by_id={}, by_member_name={})
+        cls._indexes = None
+        cls._all_members = None
+        cls._values_cache = {}
+        cls._choices_cache = {}
+        cls._filter_cache = {}
+        cls._field_cache = {}
+        cls._projectors = {}
+        cls._attr_names = None
+        cls._plain_fields = None
+
+        # Field names inherited from a class other than a model, such as
+        # a mixin, are frozen for this model.
+        if AttrName.CLASS.FIELD_NAMES not in cls.__dict__:
+            for base in cls.__mro__:
+                if AttrName.CLASS.FIELD_NAMES in base.__dict__:
+                    if not isinstance(base, StaticModelMeta):
+                        cls._field_names = base.__dict__[AttrName.CLASS.FIELD_NAMES]
+                    break
 
         # Now that the class has been created and initialized
         # sufficiently, go ahead and add the members, if any.
-        raw_members_attr_name = '_{}__raw_members'.format(cls.__name__)
-        raw_members = getattr(cls, raw_members_attr_name, None)
+        raw_members = cls.__dict__.get(AttrName.CLASS.RAW_MEMBERS)
         if raw_members is not None:
             for name, value in raw_members.items():
                 # __setattr__ is the entry point for member instance
                 # creation.
                 setattr(cls, name, value)
 
-            delattr(cls, raw_members_attr_name)
+            delattr(cls, AttrName.CLASS.RAW_MEMBERS)
 
         cls.members = StaticModelMemberManager(cls)
 
@@ -67,39 +103,62 @@ class StaticModelMeta(type):
     # Public API
     #
     def __repr__(cls):
-        return '<StaticModel {}: Members: {}, Fields: {}>'.format(
-            cls.__name__, len(cls._members.by_id), cls._field_names)
+        return (f'<StaticModel {cls.__name__}: Members: {len(cls._members.by_id)},'
+                f' Fields: {cls._field_names}>')
 
     def __getattribute__(cls, item):
-        item = str(item)
-        if item.upper() == item:
+        # Members live in the class __dict__, and are only looked up
+        # there so that models don't inherit the members of their
+        # parents. Lowercase names, the most common by far, are
+        # recognized without building an uppercase copy.
+        if not item.islower() and item.upper() == item:
             try:
-                return cls.__dict__[item]
+                return super().__getattribute__('__dict__')[item]
             except KeyError:
-                raise AttributeError('{!r} model does not contain member {!r}'.format(
-                    cls.__name__, item))
+                raise AttributeError(
+                    f'{cls.__name__!r} model does not contain member {item!r}')
         else:
             return super().__getattribute__(item)
 
     def __setattr__(cls, key, value):
-        if key.startswith('_') or key != key.upper():
+        if key == AttrName.CLASS.FIELD_NAMES:
+            value = _freeze_field_names(value)
+            super().__setattr__(AttrName.CLASS.FIELD_NAME_SET, frozenset(value))
             super().__setattr__(key, value)
+            cls._forget_attr_names()
+            cls._forget_field_values()
+        elif key.startswith('_') or key != key.upper():
+            new_attr = key not in super().__getattribute__('__dict__')
+            super().__setattr__(key, value)
+            if new_attr:
+                cls._forget_attr_names()
         else:
-            try:
-                existing_value = getattr(cls, key)
-            except AttributeError:
-                pass
-            else:
-                raise TypeError('{}.{} already exists with value {!r}'.format(
-                    cls.__name__, key, existing_value))
+            # Members are only looked up in the model's own __dict__, so
+            # a membership test there is all the existence check takes.
+            class_dict = super().__getattribute__('__dict__')
+            if key in class_dict:
+                raise TypeError(
+                    f'{cls.__name__}.{key} already exists with value {class_dict[key]!r}')
 
             if isinstance(value.__class__, cls.__class__):
                 instance = value
                 cls._process_new_instance(key, instance)
             else:
-                instance = cls(raw_value=value, member_name=key)
+                instance = cls._create_member(value, key)
 
             super().__setattr__(key, instance)
+            cls._forget_attr_names()
+
+    def __delattr__(cls, key):
+        # Members are final once defined. Cached member collections and
+        # indexes rely on it.
+        if key.startswith('_') or key != key.upper():
+            super().__delattr__(key)
+            cls._forget_attr_names()
+        elif key in super().__getattribute__('__dict__'):
+            raise TypeError(f'{cls.__name__}.{key} is a member and cannot be deleted')
+        else:
+            super().__delattr__(key)
 
     def __call__(
             cls, raw_value=None, member_name=None, field_names=None, *field_values,
@@ -112,33 +171,85 @@ class StaticModelMeta(type):
             raise ValueError(
                 "Value for 'member_name' parameter must be all uppercase.")
 
-        if raw_value and isinstance(raw_value, Iterable) and not isinstance(raw_value, str):
-            field_values = raw_value
-
-        field_names = field_names or getattr(cls, '_field_names', None)
-        if not field_names:
-            raise ValueError("At lease one field must be defined")
-
-        instance = super().__call__(**dict(zip(field_names, field_values)))
-
-        setattr(instance, AttrName.INSTANCE.RAW_VALUE, raw_value)
-
-        cls._process_new_instance(member_name, instance)
-
-        return instance
+        return cls._create_member(raw_value, member_name, field_names, field_values)
 
     def submodels(cls):
         return (submodel for submodel in cls._submodels.keys())
 
     def register_submodel(cls, submodel):
         cls._submodels[submodel] = None
+        cls._forget_attr_names()
 
     def remove_submodel(cls, submodel):
         del cls._submodels[submodel]
+        cls._forget_attr_names()
 
     #
     # Private API
     #
+    def _create_member(cls, raw_value, member_name, field_names=None, field_values=()):
+        # Arguments have been validated by __call__, or come from a
+        # member declaration, whose name is uppercase by definition.
+        # Iterability is checked on the type, as the Iterable ABC does,
+        # without going through its instance check machinery.
+        if (raw_value and not isinstance(raw_value, str) and
+                getattr(raw_value.__class__, '__iter__', None) is not None):
+            field_values = raw_value
+
+        model_field_names = getattr(cls, AttrName.CLASS.FIELD_NAMES, None)
+        field_names = field_names or model_field_names
+        if not field_names:
+            raise ValueError("At lease one field must be defined")
+
+        # Strings are interned so that members sharing a value share
+        # the object, and index lookups compare them by identity.
+        field_values = tuple(
+            intern(value) if value.__class__ is str else value
+            for value in field_values)[:len(field_names)]
+        if (len(field_values) == len(field_names) and
+                cls.__new__ is object.__new__ and cls.__init__ is StaticModel.__init__):
+            # Nothing to customize construction, so skip the generic
+            # instantiation path.
+            instance = _make_builder(tuple(field_names))(cls, *field_values)
+        else:
+            instance = super().__call__(**dict(zip(field_names, field_values)))
+            # A custom constructor may store something else than the
+            # given values.
+            field_values = ()
+
+        # The attributes are stored in the instance __dict__ directly
+        # rather than through setattr(), as this runs for every member.
+        instance_dict = instance.__dict__
+        instance_dict[AttrName.INSTANCE.RAW_VALUE] = raw_value
+        # The field values are only kept when they line up with the
+        # model's field names, and read back the same as the member's
+        # attributes.
+        if field_names is not model_field_names or not cls._has_plain_fields():
+            field_values = ()
+        instance_dict[AttrName.INSTANCE.FIELD_VALUES] = field_values
+        # Setting the member name up front spares
+        # _process_new_instance() the lookup of a missing attribute,
+        # which raises internally.
+        instance_dict[AttrName.INSTANCE.MEMBER_NAME] = member_name
+
+        cls._process_new_instance(member_name, instance)
+
+        return instance
+
+    def _has_plain_fields(cls):
+        # Whether the model's fields are plain instance attributes. A
+        # data descriptor, such as a property, takes precedence over
+        # the instance __dict__, so a field it shadows reads back
+        # something else than the value the member was given.
+        plain_fields = cls._plain_fields
+        if plain_fields is None:
+            plain_fields = cls._plain_fields = not any(
+                _is_data_descriptor(model.__dict__[field_name])
+                for model in cls.__mro__
+                for field_name in cls._field_names
+                if field_name in model.__dict__)
+        return plain_fields
+
     def _populate_ancestors(cls, child):
         # This method recursively adds sub_class members to all
         # ancestor classes that are instances of this metaclass,
@@ -150,74 +261,204 @@ class StaticModelMeta(type):
             if isinstance(parent, mcs):
                 if parent is StaticModel:
                     continue
-                for member in cls._members.by_id.values():
-                    member_name = getattr(
-                        member, AttrName.INSTANCE.MEMBER_NAME, None)
-                    if member_name is not None:
-                        setattr(parent, member_name, member)
+                parent._add_members(
+                    member for member in cls._members.by_id.values()
+                    if getattr(member, AttrName.INSTANCE.MEMBER_NAME, None) is not None)
                 parent.register_submodel(cls)
                 cls._populate_ancestors(parent)
 
+    def _add_members(cls, members):
+        # Bulk counterpart of assigning existing members one at a time
+        # through __setattr__, for members gained from a submodel. The
+        # cached attribute names are only forgotten once.
+        class_dict = super().__getattribute__('__dict__')
+        for member in members:
+            member_name = getattr(member, AttrName.INSTANCE.MEMBER_NAME)
+            if member_name in class_dict:
+                raise TypeError(
+                    f'{cls.__name__}.{member_name} already exists with value'
+                    f' {class_dict[member_name]!r}')
+            cls._process_new_instance(member_name, member)
+            super().__setattr__(member_name, member)
+        cls._forget_attr_names()
+
     def _process_new_instance(cls, member_name, instance):
         instance_member_name = getattr(instance, AttrName.INSTANCE.MEMBER_NAME, None)
         if instance_member_name and member_name and instance_member_name != member_name:
-            raise ValueError('Member {!r} already has a member name'.format(instance))
+            raise ValueError(f'Member {instance!r} already has a member name')
 
-        setattr(instance, AttrName.INSTANCE.MEMBER_NAME, member_name)
+        instance_dict = instance.__dict__
+        instance_dict[AttrName.INSTANCE.MEMBER_NAME] = member_name
+        instance_dict[AttrName.INSTANCE.REPR] = None
 
-        cls._members.by_id[id(instance)] = instance
         if member_name is not None:
             cls._members.by_member_name[member_name] = instance
-        cls._index_instance(instance)
-
-    def _index_instance(cls, instance):
-        for index_attr in (AttrName.INSTANCE.RAW_VALUE,) + cls._field_names:
-            index = cls._indexes.setdefault(index_attr, OrderedDict())
-            try:
-                value = getattr(instance, index_attr)
-            except AttributeError:
-                continue
-            else:
-                key = cls._index_key_for_value(value)
-                index.setdefault(key, []).append(instance)
-
-    def _index_key_for_value(cls, value):
+        # An unnamed member may be registered again once it is bound to
+        # a name. It is only indexed the first time, and the tuple of
+        # all members and the columns built from it stay valid.
+        # Registration and indexing are done under the index lock, so
+        # that a member added while the indexes are built is either
+        # indexed by the build or here, once.
+        with _index_lock:
+            new_member = id(instance) not in cls._members.by_id
+            if new_member:
+                cls._members.by_id[id(instance)] = instance
+                if cls._indexes is not None:
+                    cls._index_instance(instance, cls._indexes)
+        cls._clear_caches(new_member)
+
+    def _clear_caches(cls, members_changed=True):
+        # Searches and choices depend on member names, so they are
+        # always cleared. The rest only depends on the set of members.
+        if members_changed:
+            cls._all_members = None
+            cls._values_cache.clear()
+            cls._field_cache.clear()
+        cls._choices_cache.clear()
+        cls._filter_cache.clear()
+
+    def _forget_field_values(cls):
+        # The field names of the model changed, so the field values
+        # stored on its members, and everything derived from them, no
+        # longer hold. Submodels may have inherited the field names.
+        for member in cls._members.by_id.values():
+            member._field_values = ()
+            member._repr = None
+        cls._plain_fields = None
+        cls._indexes = None
+        cls._projectors.clear()
+        cls._clear_caches()
+        for submodel in cls.submodels():
+            submodel._forget_field_values()
+
+    def _get_indexes(cls):
+        # Indexes are built on the first member search, so models that
+        # are never searched don't pay for them. Members added later
+        # are indexed as they are added. The indexes are only published
+        # once complete, so that a concurrent search never sees them
+        # half built, and are built under the index lock, so that no
+        # member added meanwhile is missed.
+        indexes = cls._indexes
+        if indexes is None:
+            with _index_lock:
+                indexes = cls._indexes
+                if indexes is None:
+                    # Members are only ever appended, so those added by
+                    # the build itself, through a property for instance,
+                    # are found after the ones already indexed.
+                    indexes = {}
+                    indexed = 0
+                    while indexed < len(cls._members.by_id):
+                        instances = tuple(cls._members.by_id.values())[indexed:]
+                        indexed += len(instances)
+                        for instance in instances:
+                            cls._index_instance(instance, indexes)
+                    cls._indexes = indexes
+        return indexes
+
+    def _index_instance(cls, instance, indexes):
+        field_names = cls._field_names
+        # The field values stored on the member are used when they line
+        # up with the field names of this model, which saves an
+        # attribute lookup per field. They are in the order of the
+        # field names of the member's own model, which may reorder or
+        # rename fields, and are only kept when they match the member's
+        # attributes (see _create_member()). The attributes are read
+        # otherwise.
+        field_values = getattr(instance, AttrName.INSTANCE.FIELD_VALUES, ())
+        if (instance.__class__._field_names is not field_names or
+                len(field_values) != len(field_names)):
+            field_values = (
+                getattr(instance, field_name, _missing) for field_name in field_names)
+        raw_value = getattr(instance, AttrName.INSTANCE.RAW_VALUE, _missing)
+
+        for index_attr, value in zip(
+                (AttrName.INSTANCE.RAW_VALUE,) + field_names,
+                chain((raw_value,), field_values)):
+            index = indexes.setdefault(index_attr, {})
+            if value is not _missing:
+                index.setdefault(_index_key(value), []).append(instance)
+
+    def _get_all_members(cls):
+        # Tuple of all members, rebuilt only after members are added.
+        all_members = cls._all_members
+        if all_members is None:
+            all_members = cls._all_members = tuple(cls._members.by_id.values())
+        return all_members
+
+    def _get_attr_names(cls):
+        # Names that may be rendered by .values() and .values_list():
+        # the attributes and field names of the model and its
+        # submodels. Kept until one of those models gains or loses an
+        # attribute, or submodels change.
+        attr_names = cls._attr_names
+        if attr_names is None:
+            attr_names = cls._attr_names = frozenset(chain(
+                (AttrName.INSTANCE.MEMBER_NAME,),
+                chain(cls.__dict__.keys(), cls._field_names),
+                chain.from_iterable(chain(
+                    submodel.__dict__.keys(), submodel._field_names)
+                        for submodel in cls.submodels())
+                ))
+        return attr_names
+
+    def _forget_attr_names(cls):
+        # The cached names of a model cover its submodels, so every
+        # ancestor forgets them too.
+        for model in cls.__mro__:
+            if isinstance(model, StaticModelMeta):
+                type.__setattr__(model, '_attr_names', None)
+
+    def _get_rendered_values(cls, field_names, flat):
+        # Rendering of the given model fields across all members, as
+        # used by .values_list(). Returns the members the rendering was
+        # built from, along with the rendering.
+        key = field_names, flat
         try:
-            return hash(value)
-        except TypeError:
-            return hash(repr(value))
+            return cls._values_cache[key]
+        except KeyError:
+            members = cls._get_all_members()
+            rendered = tuple(_render_values(members, field_names, False, flat))
+            cls._values_cache[key] = members, rendered
+            return members, rendered
+
+    def _get_projector(cls, field_names, as_dict):
+        # Projectors are kept by the model they render members of, so
+        # that they don't outlive it.
+        key = field_names, as_dict
+        try:
+            return cls._projectors[key]
+        except KeyError:
+            project = cls._projectors[key] = _make_projector(cls, field_names, as_dict)
+            return project
 
     def _get_index_search_results(cls, criteria):
-        # Make sure ATTR_NAME.INSTANCE_VAR.MEMBER_NAME gets processed
-        # first if it is present. There is no point in hitting the
-        # other indexes if we miss there.
-        sorted_kwargs = sorted(
-            criteria.items(),
-            key=lambda x: x[0] != AttrName.INSTANCE.MEMBER_NAME)
-
-        for field_name, field_value in sorted_kwargs:
+        # Every member matching the criteria is in the index bucket of
+        # each criterion, so only the smallest bucket needs to be
+        # searched. All criteria are looked up so that invalid fields
+        # are always reported.
+        indexes = cls._get_indexes()
+        results = None
+        for field_name, field_value in criteria.items():
             if field_name == AttrName.INSTANCE.MEMBER_NAME:
-                index = cls._members.by_member_name
-                try:
-                    result = index[field_value]
-                except KeyError:
-                    raise StopIteration
-                else:
-                    yield result
+                member = cls._members.by_member_name.get(field_value)
+                result = () if member is None else (member,)
 
             else:
                 try:
-                    index = cls._indexes[field_name]
+                    index = indexes[field_name]
                 except KeyError:
-                    if field_name in cls._field_names:
-                        continue
+                    if field_name in cls._field_name_set:
+                        result = ()
                     else:
-                        raise cls.InvalidField(
-                            'Invalid field {!r}'.format(field_name))
+                        raise cls.InvalidField(f'Invalid field {field_name!r}')
                 else:
-                    result = index.get(cls._index_key_for_value(field_value), [])
-                    for item in result:
-                        yield item
+                    result = index.get(_index_key(field_value), ())
+
+            if results is None or len(result) < len(results):
+                results = result
+
+        return results
 
 
 class StaticModelMemberManager:
@@ -235,68 +476,104 @@ class StaticModelMemberManager:
     # Public API
     #
     def all(self):
-        return StaticModelMembers(
-            self.model._members.by_id.values(), model=self.model)
+        return StaticModelMembers(self.model._get_all_members(), model=self.model)
 
     def filter(self, **criteria):
         if not criteria:
             return self.all()
 
-        index_search_results = self.model._get_index_search_results(criteria)
-
-        results = []
-
-        validated_member_ids = set()
-        for member in index_search_results:
-            for field_name, field_value in criteria.items():
-                if (field_name == AttrName.INSTANCE.MEMBER_NAME and
-                        self.model._members.by_member_name.get(
-                            field_value) is member):
-                    continue
-
-                try:
-                    value = getattr(member, field_name)
-                except AttributeError:
-                    break
-
-                if value != field_value:
-                    break
-
-            else:
-                member_id = id(member)
-                if member_id not in validated_member_ids:
-                    validated_member_ids.add(member_id)
-                    results.append(member)
-
-        return StaticModelMembers(results, model=self.model)
+        return StaticModelMembers(self._filter(criteria), model=self.model)
 
     def get(self, _return_none=False, **kwargs):
-        results = self.filter(**kwargs)
+        if kwargs:
+            results = self._filter(kwargs)
+        else:
+            results = self.model._get_all_members()
+
         if not results:
             if _return_none:
                 return None
             else:
                 raise self.model.DoesNotExist(
-                    '{}.members.get({}) yielded no objects.'.format(
-                        self.model.__name__, format_kwargs(kwargs)))
+                    f'{self.model.__name__}.members.get({format_kwargs(kwargs)})'
+                    ' yielded no objects.')
 
         elif len(results) == 1:
             return results[0]
         else:
             raise self.model.MultipleObjectsReturned(
-                '{}.members.get({}) yielded multiple objects.'.format(
-                    self.model.__name__, format_kwargs(kwargs)))
+                f'{self.model.__name__}.members.get({format_kwargs(kwargs)})'
+                ' yielded multiple objects.')
 
     def choices(self, *fields, **criteria):
+        # Choices are commonly generated for model field definitions
+        # over and over with the same arguments, so they are kept until
+        # members are added. Like searches, empty choices are not kept,
+        # and only the latest are.
+        choices_cache = self.model._choices_cache
+        key = fields, tuple(sorted(criteria.items()))
+        try:
+            choices = choices_cache.get(key)
+        except TypeError:
+            # Unhashable criteria values can't be cached.
+            return self._choices(fields, criteria)
+
+        if choices is None:
+            choices = tuple(self._choices(fields, criteria))
+            _cache_results(choices_cache, key, choices)
+        return list(choices)
+
+    def cache_clear(self):
+        """
+        Discard the search results, choices and renderings cached by the
+        model. They are discarded whenever the model gains members, so
+        this is only needed to measure or test uncached queries.
+        """
+        self.model._clear_caches()
+
+    #
+    # Private API
+    #
+    def _filter(self, criteria):
+        # Results are kept until members are added, like choices. The
+        # criteria may come from user input, so searches that find
+        # nothing are not kept, and only the latest searches are.
+        filter_cache = self.model._filter_cache
+        try:
+            key = frozenset(criteria.items())
+            results = filter_cache.get(key)
+        except TypeError:
+            # Unhashable criteria values can't be cached.
+            return self._search(criteria)
+
+        if results is None:
+            results = tuple(self._search(criteria))
+            _cache_results(filter_cache, key, results)
+        return results
+
+    def _search(self, criteria):
+        # Index search results only need to be checked against the
+        # criteria; members are indexed at most once, so there is
+        # nothing to de-duplicate. The predicate is only built once the
+        # index search has validated the field names.
+        results = self.model._get_index_search_results(criteria)
+        if not results:
+            return []
+        predicate = _make_predicate(tuple(criteria.keys()))
+        field_values = tuple(criteria.values())
+        return [member for member in results if predicate(member, field_values)]
+
+    def _choices(self, fields, criteria):
         if len(fields) > 2:
             raise ValueError(
-                'Maximum number of specified fields for {0}.members.choices() is 2'.format(
-                    self.model.__name__))
+                f'Maximum number of specified fields for {self.model.__name__}.members.choices()'
+                ' is 2')
         if fields:
             for field in fields:
-                if field not in self.model._field_names:
-                    raise ValueError('{0}.members.choices() requires {0} field name(s)'.format(
-                        self.model.__name__))
+                if field not in self.model._field_name_set:
+                    raise ValueError(
+                        f'{self.model.__name__}.members.choices() requires'
+                        f' {self.model.__name__} field name(s)')
         else:
             fields = self.model._field_names[:2]
 
@@ -306,6 +583,15 @@ class StaticModelMemberManager:
         return self.filter(**criteria).values_list(*fields)
 
 
+def _cache_results(cache, key, results):
+    # Keep non-empty query results, dropping the oldest ones past the
+    # size limit.
+    if results:
+        if len(cache) >= _QUERY_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = results
+
+
 class StaticModel(metaclass=StaticModelMeta):
     """
     Base class for static models.
@@ -325,18 +611,47 @@ class StaticModel(metaclass=StaticModelMeta):
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # The field values stored on a member, and the indexes and
+        # renderings its models built from them, no longer hold once
+        # one of its attributes is reassigned.
+        if not name.startswith('_') and AttrName.INSTANCE.FIELD_VALUES in self.__dict__:
+            self.__dict__[AttrName.INSTANCE.FIELD_VALUES] = ()
+            self.__dict__[AttrName.INSTANCE.REPR] = None
+            for model in self.__class__.__mro__:
+                if isinstance(model, StaticModelMeta):
+                    model._indexes = None
+                    model._clear_caches()
+
     def __repr__(self):
-        return '<{}.{}: {}>'.format(
-            self.__class__.__name__,
-            getattr(self, AttrName.INSTANCE.MEMBER_NAME),
-            format_kwargs(self._as_dict),
-        )
+        # Members don't change once defined, so the repr is only
+        # rendered once.
+        rendered = getattr(self, AttrName.INSTANCE.REPR, None)
+        if rendered is None:
+            rendered = (
+                f'<{self.__class__.__name__}.{getattr(self, AttrName.INSTANCE.MEMBER_NAME)}:'
+                f' {format_kwargs(self._as_dict)}>')
+            setattr(self, AttrName.INSTANCE.REPR, rendered)
+        return rendered
+
+    def __reduce_ex__(self, protocol):
+        # Named members are pickled (and copied) by reference to the
+        # model attribute they are bound to, so they unpickle to the
+        # same object.
+        member_name = getattr(self, AttrName.INSTANCE.MEMBER_NAME, None)
+        if member_name is not None:
+            for model in self.__class__.__mro__:
+                if model.__dict__.get(member_name) is self:
+                    return getattr, (model, member_name)
+
+        return super().__reduce_ex__(protocol)
 
     @property
     def _as_dict(self):
-        return OrderedDict(
-            (field_name, getattr(self, field_name, None))
-            for field_name in self._field_names)
+        return {
+            field_name: getattr(self, field_name, None)
+            for field_name in self._field_names}
 
 
 class StaticModelMembers(list):
@@ -345,47 +660,208 @@ class StaticModelMembers(list):
         self.model = kwargs.pop('model')
         super().__init__(*args, **kwargs)
 
-    def _values_base(self, item_func, *field_names, **kwargs):
+    def _values_base(self, as_dict, *field_names, **kwargs):
         allow_flat = kwargs.pop('allow_flat', False)
         flat = kwargs.pop('flat', False)
 
         if not field_names:
-            field_names = self.model._field_names
+            field_names = tuple(self.model._field_names)
 
-        elif not frozenset(field_names).issubset(frozenset(chain(
-                (AttrName.INSTANCE.MEMBER_NAME,
-                 AttrName.INSTANCE.MEMBER_NAME),
-                chain(self.model.__dict__.keys(), self.model._field_names),
-                chain.from_iterable(chain(
-                    submodel.__dict__.keys(), submodel._field_names)
-                        for submodel in self.model.submodels())
-                ))):
+        elif not self.model._get_attr_names().issuperset(field_names):
             raise ValueError(
                 "Field names must be a subset of those available.")
 
-        results = []
+        flat = allow_flat and flat
+        if not as_dict and self.model._field_name_set.issuperset(field_names):
+            # Model fields don't change, so their rendering across all
+            # members is kept by the model.
+            members, rendered = self.model._get_rendered_values(field_names, flat)
+            if len(self) == len(members) and all(map(is_, self, members)):
+                return list(rendered)
+
+        return _render_values(self, field_names, as_dict, flat)
+
+    def values(self, *field_names, **kwargs):
+        return self._values_base(True, *field_names, **kwargs)
+
+    def values_list(self, *field_names, **kwargs):
+        return self._values_base(False, *field_names, allow_flat=True, **kwargs)
+
+
+def _render_values(items, field_names, as_dict, flat):
+    # Falsy renderings are left out, as are falsy values when the
+    # renderings are flattened.
+    rendered = (
+        item.__class__._get_projector(field_names, as_dict)(item) for item in items)
+    if flat:
+        rendered = chain.from_iterable(rendered)
+    return list(filter(None, rendered))
+
+
+def _is_data_descriptor(value):
+    value_type = value.__class__
+    return hasattr(value_type, '__set__') or hasattr(value_type, '__delete__')
+
+
+def _freeze_field_names(field_names):
+    field_names = tuple(map(intern, field_names))
+    return _interned_field_names.setdefault(field_names, field_names)
+
+
+_atomic_types = frozenset((int, str, bytes, float, bool, type(None)))
+
+
+def _index_key(value):
+    # Hashable values are their own index keys, and values of the
+    # common field types are known to be hashable. Unhashable values
+    # are keyed by their repr. Members found through a key are always
+    # compared against the searched value.
+    value_type = value.__class__
+    if value_type in _atomic_types:
+        return value
+    if value_type.__hash__ is None:
+        # Lists, dicts and the like are known to be unhashable by
+        # their type, so no TypeError needs to be raised and caught.
+        return repr(value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    else:
+        return value
+
+
+@lru_cache(maxsize=256)
+def _make_builder(field_names):
+    # Generate the function that creates a member with the given field
+    # values, one positional argument per field name, the same way
+    # collections.namedtuple generates its constructor.
+    args = ', '.join(f'_{i}' for i in range(len(field_names)))
+    items = ', '.join(f'{field_name!r}: _{i}' for i, field_name in enumerate(field_names))
+    source = (
+        f'def build(cls, {args}):\n'
+        f'    instance = new(cls)\n'
+        f'    instance.__dict__ = {{{items}}}\n'
+        f'    return instance\n'
+    )
+    namespace = {'new': object.__new__}
+    exec(compile(source, f'<staticmodel builder {field_names}>', 'exec'), namespace)
+    return namespace['build']
+
+
+def _make_projector(cls, field_names, as_dict=False):
+    # Build the function that renders a member of ``cls`` for
+    # .values() or .values_list(). Only fields defined on the member's
+    # own model are rendered by .values(); the others are placeholders.
+    # The projectors read the _field_values attribute directly, which is
+    # much cheaper than going through getattr().
+    if as_dict:
+        model_field_names = cls._field_name_set
+        field_count = len(cls._field_names)
+        # Fields missing from the model are picked from a None
+        # appended to the field values.
+        positions = tuple(
+            cls._field_names.index(field_name) if field_name in model_field_names
+            else field_count for field_name in field_names)
+        padded = field_count in positions
+        pick = _make_picker(positions)
+        present_field_names = tuple(
+            (field_name, field_name in model_field_names) for field_name in field_names)
+
+        def project(item):
+            field_values = item._field_values
+            if len(field_values) == field_count:
+                if padded:
+                    field_values += (None,)
+                return OrderedDict(zip(field_names, pick(field_values)))
+            return OrderedDict(
+                (field_name, getattr(item, field_name, None) if present else None)
+                for field_name, present in present_field_names)
+    elif tuple(cls._field_names[:len(field_names)]) == field_names:
+        # The requested fields lead the model's fields, so the tuple of
+        # field values stored on the member can be handed out as is.
+        field_count = len(field_names)
+        getter = _make_getter(field_names)
+
+        def project(item):
+            field_values = item._field_values
+            if len(field_values) == field_count:
+                return field_values
+            elif len(field_values) > field_count:
+                return field_values[:field_count]
+            else:
+                return getter(item)
+    elif cls._field_name_set.issuperset(field_names):
+        # The requested fields are all model fields, so they can be
+        # picked out of the stored tuple of field values by position.
+        field_count = len(cls._field_names)
+        positions = tuple(cls._field_names.index(field_name) for field_name in field_names)
+        pick = _make_picker(positions)
+        getter = _make_getter(field_names)
+
+        def project(item):
+            field_values = item._field_values
+            if len(field_values) == field_count:
+                return pick(field_values)
+            else:
+                return getter(item)
+    else:
+        project = _make_getter(field_names)
+
+    return project
+
+
+def _make_picker(positions):
+    # Build the function that returns the tuple of the items at the
+    # given positions of a sequence.
+    if len(positions) > 1:
+        return itemgetter(*positions)
+
+    position = positions[0]
 
-        if allow_flat and flat:
-            for rendered_item in chain.from_iterable(
-                    item_func(item, field_names) for item in self):
-                if rendered_item:
-                    results.append(rendered_item)
+    def pick(sequence):
+        return sequence[position],
+
+    return pick
+
+
+@lru_cache(maxsize=256)
+def _make_getter(field_names):
+    # Build the function that returns the tuple of the given attribute
+    # values of an object, with None for missing attributes. All values
+    # are fetched with a single attrgetter call unless one is missing.
+    getter = attrgetter(*field_names)
+
+    def get_values(item):
+        try:
+            values = getter(item)
+        except AttributeError:
+            return tuple(getattr(item, field_name, None) for field_name in field_names)
         else:
-            for item in self:
-                rendered_item = item_func(item, field_names)
-                if rendered_item:
-                    results.append(rendered_item)
+            return values if len(field_names) > 1 else (values,)
 
-        return results
+    return get_values
+
+
+@lru_cache(maxsize=256)
+def _make_predicate(field_names):
+    # Build the function that validates index search results against
+    # .filter() criteria, given as a tuple of values in the order of
+    # field_names. The member's values are fetched with a single
+    # attrgetter call and compared as a tuple.
+    getter = attrgetter(*field_names)
+
+    if len(field_names) == 1:
+        def predicate(member, field_values):
+            try:
+                return getter(member) == field_values[0]
+            except AttributeError:
+                return False
+    else:
+        def predicate(member, field_values):
+            try:
+                return getter(member) == field_values
+            except AttributeError:
+                return False
 
-    def _values_item(item, field_names):
-        item_dict = item._as_dict
-        return OrderedDict((key, item_dict.pop(key, None)) for key in field_names)
-    values = partialmethod(_values_base, _values_item)
-
-    def _values_list_item(item, field_names):
-        rendered_item = []
-        for field_name in field_names:
-            rendered_item.append(getattr(item, field_name, None))
-        return tuple(rendered_item)
-    values_list = partialmethod(_values_base, _values_list_item, allow_flat=True)
+    return predicate
@@ -50,6 +50,7 @@ class StaticModelFieldMixin:
 
         kwargs['choices'] = tuple(self._static_model.members.choices(
             self._value_field_name, self._display_field_name))
+        self._member_values = frozenset(value for value, display in kwargs['choices'])
 
         super().__init__(*args, **kwargs)
 
@@ -79,6 +80,14 @@ class StaticModelFieldMixin:
         return name, path, args, kwargs
 
     def _validate_field_values(self, *constructor_args, **constructor_kwargs):
+        # Fields are constructed over and over, by migrations for
+        # instance, so validation results are kept by the static model,
+        # which forgets them when it gains members.
+        validated = self._static_model._field_cache
+        key = self._validation_key(*constructor_args, **constructor_kwargs)
+        if key in validated:
+            return
+
         for member in self._static_model.members.all():
             value = getattr(member, self._value_field_name, None)
             self._validate_member_value(member, value, *constructor_args, **constructor_kwargs)
@@ -89,6 +98,16 @@ class StaticModelFieldMixin:
                     'Field {!r} of member {!r} must be a string.'.format(
                         self._display_field_name, member._member_name))
 
+        validated[key] = True
+
+    def _validation_key(self, *constructor_args, **constructor_kwargs):
+        # Fields with the same validation key are only validated once
+        # against the members of the static model. Subclasses whose
+        # _validate_member_value() depends on constructor arguments
+        # must add them to the key, as StaticModelCharField does with
+        # max_length.
+        return self.__class__, self._value_field_name, self._display_field_name
+
     def _validate_member_value(self, member, value, *constructor_args, **constructor_kwargs):
         raise NotImplementedError
 
@@ -126,6 +145,17 @@ class StaticModelFieldMixin:
         self.run_validators(db_value)
         return sm_value
 
+    def validate(self, value, model_instance):
+        # Member values are valid choices by construction. Checking them
+        # against the set of member values avoids the linear scan of
+        # the choices done by the parent field.
+        try:
+            if value not in self.empty_values and value in self._member_values:
+                return
+        except TypeError:
+            pass
+        super().validate(value, model_instance)
+
     def contribute_to_class(self, cls, name, **kwargs):
         super().contribute_to_class(cls, name, **kwargs)
 
@@ -147,6 +177,10 @@ class StaticModelCharField(StaticModelStringFieldMixin, models.CharField):
     def get_internal_type(self):
         return 'CharField'
 
+    def _validation_key(self, *constructor_args, **constructor_kwargs):
+        return super()._validation_key(
+            *constructor_args, **constructor_kwargs) + (constructor_kwargs.get('max_length'),)
+
     def _validate_member_value(self, member, value, *constructor_args, **constructor_kwargs):
         super()._validate_member_value(
             member, value, *constructor_args, **constructor_kwargs)
@@ -2,7 +2,7 @@ import json
 
 
 def format_kwargs(kwargs):
-    return ', '.join('{}={!r}'.format(k, v) for k, v in kwargs.items())
+    return ', '.join(f'{k}={v!r}' for k, v in kwargs.items())
 
 
 def jsonify(obj):
@@ -1,7 +1,13 @@
+import gc
+import weakref
+from unittest import mock
+
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from django_test_app.models import Integer, String, TestModel
+from staticmodel import StaticModel
+from staticmodel.django.models import StaticModelCharField
 
 
 class CharFieldTest(TestCase):
@@ -190,3 +196,42 @@ class IntegerFieldTest(TestCase):
 
     def tearDown(self):
         TestModel.objects.all().delete()
+
+
+class FieldValidationTest(SimpleTestCase):
+    def setUp(self):
+        class Color(StaticModel):
+            _field_names = 'code', 'display'
+            RED = 'red', 'Red'
+            BLUE = 'blue', 'Blue'
+
+        self.Color = Color
+
+    def make_field(self):
+        return StaticModelCharField(static_model=self.Color, max_length=10)
+
+    def test_validated_once(self):
+        with mock.patch.object(
+                StaticModelCharField, '_validate_member_value', autospec=True) as validate:
+            self.make_field()
+            self.assertEqual(validate.call_count, 2)
+            self.make_field()
+            self.assertEqual(validate.call_count, 2)
+
+            StaticModelCharField(static_model=self.Color, max_length=20)
+            self.assertEqual(validate.call_count, 4)
+
+    def test_validated_again_after_new_member(self):
+        self.make_field()
+        self.Color.GREEN = 'green', 'Green'
+        self.assertEqual(len(self.make_field().choices), 3)
+
+        self.Color.TOO_LONG = 'much too long', 'Too long'
+        self.assertRaises(ValueError, self.make_field)
+
+    def test_static_model_released(self):
+        self.make_field()
+        model = weakref.ref(self.Color)
+        del self.Color
+        gc.collect()
+        self.assertIsNone(model())
@@ -1,6 +1,13 @@
+import copy
+from collections import OrderedDict
+import gc
+import pickle
+import weakref
 from unittest import TestCase
 
+import staticmodel
 from staticmodel import StaticModel
+from staticmodel.core import _make_predicate
 from types import SimpleNamespace
 
 
@@ -118,6 +125,11 @@ class MUTABLE(OBJECT):
     NAMESPACE = 27, "namespace", "Namespace", SimpleNamespace(**DICT[3])
 
 
+class COUNTRY(StaticModel):
+    _field_names = 'code', 'name'
+    FRANCE = 'fr', 'France'
+
+
 class StaticModelTests(TestCase):
     maxDiff = None
     # TODO: Increase test coverage
@@ -164,6 +176,8 @@ class StaticModelTests(TestCase):
             'name': 'Auschwitz',
             'gis_location': (50.04, 19.18)
         }])
+        for values in (PLACE.members.all().values(), THING.members.all().values()):
+            self.assertIs(type(values[0]), OrderedDict)
 
     def test_values_list(self):
         descriptions = OBJECT.members.all().values_list('description', flat=True)
@@ -210,3 +224,267 @@ class StaticModelTests(TestCase):
             "MUTABLE.DICT, id=26, code='class': Dict",
             "MUTABLE.NAMESPACE, id=27, code='namespace': Namespace",
         ])
+
+    def test_values_list_flat_field(self):
+        self.assertEqual(PLACE.members.all().values_list('code', flat=True), [
+            'jerusalem', 'geneva', 'auschwitz', 'paris'])
+        self.assertEqual(PLACE.members.filter(continent='Asia').values_list(
+            'code', flat=True), ['jerusalem'])
+        self.assertEqual(THING.members.all().values_list('is_organic', flat=True), [
+            True, True])
+
+    def test_values_list_reordered_fields(self):
+        self.assertEqual(PLACE.members.filter(continent='Asia').values_list(
+            'continent', 'code'), [('Asia', 'jerusalem')])
+        self.assertEqual(OBJECT.members.filter(code='rock').values_list(
+            'is_organic', 'name'), [(False, 'Rock')])
+
+    def test_values_list_cached(self):
+        key = ('code', 'name'), False
+        codes = PLACE.members.all().values_list('code', 'name')
+        cached = PLACE._values_cache[key]
+        codes.append(None)
+        self.assertEqual(PLACE.members.all().values_list('code', 'name'), codes[:-1])
+        self.assertIs(PLACE._values_cache[key], cached)
+
+        PLACE.members.cache_clear()
+        self.assertNotIn(key, PLACE._values_cache)
+        self.assertEqual(PLACE.members.all().values_list('code', 'name'), codes[:-1])
+        self.assertIsNot(PLACE._values_cache[key], cached)
+        self.assertEqual(PLACE._values_cache[key], cached)
+
+        self.assertEqual(PLACE.members.filter(continent='Europe').values_list(
+            'code', 'name'), codes[1:-1])
+
+    def test_filter_member_name(self):
+        self.assertEqual(PLACE.members.filter(_member_name='PARIS'), [PLACE.PARIS])
+        self.assertEqual(PLACE.members.filter(_member_name='PARIS', continent='Asia'), [])
+        self.assertEqual(PLACE.members.filter(_member_name='ROME'), [])
+        self.assertIsNone(PLACE.members.get(_member_name='ROME', _return_none=True))
+
+    def test_members_are_final(self):
+        with self.assertRaises(TypeError):
+            PLACE.PARIS = PLACE.GENEVA
+        with self.assertRaises(TypeError):
+            del PLACE.PARIS
+        self.assertIs(PLACE.members.get(code='paris'), PLACE.PARIS)
+        with self.assertRaises(AttributeError):
+            del PLACE.NOWHERE
+        with self.assertRaises(AttributeError):
+            del THING.PARIS
+
+    def test_choices(self):
+        self.assertEqual(THING.members.choices('code', is_organic=True), [
+            ('plant', 'plant'), ('animal', 'animal')])
+        self.assertEqual(THING.members.choices('code', is_organic=True), [
+            ('plant', 'plant'), ('animal', 'animal')])
+        self.assertEqual(MUTABLE.members.choices('code', obj=['a', 'b', 'c']), [
+            ('list', 'list')])
+
+    def test_pickle(self):
+        for member in (PLACE.PARIS, THING.PLANT, OBJECT.members.get(code='paris')):
+            self.assertIs(pickle.loads(pickle.dumps(member)), member)
+            self.assertIs(copy.deepcopy(member), member)
+
+    def test_pickle_unnamed(self):
+        member = COUNTRY(None, None, None, 'it', 'Italy')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(member, protocol))
+            self.assertIsInstance(unpickled, COUNTRY)
+            self.assertEqual((unpickled.code, unpickled.name), ('it', 'Italy'))
+            self.assertIsNone(unpickled._member_name)
+
+    def test_filter_after_new_member(self):
+        class COLOR(StaticModel):
+            _field_names = 'id', 'code'
+            RED = 1, 'red'
+
+        self.assertEqual(COLOR.members.filter(code='blue'), [])
+        self.assertIsNone(COLOR.members.get(code='blue', _return_none=True))
+        COLOR.BLUE = 2, 'blue'
+        self.assertEqual(COLOR.members.filter(code='blue'), [COLOR.BLUE])
+        self.assertIs(COLOR.members.get(code='blue'), COLOR.BLUE)
+
+    def test_custom_init(self):
+        class SCALED(StaticModel):
+            _field_names = 'id', 'value'
+            ONE = 1, 1
+            TWO = 2, 2
+
+            def __init__(self, id, value):
+                self.id = id
+                self.value = value * 10
+
+        self.assertEqual(SCALED.members.all().values_list('id', 'value'), [(1, 10), (2, 20)])
+        self.assertEqual(SCALED.members.all().values('value'), [{'value': 10}, {'value': 20}])
+        self.assertIs(SCALED.members.get(value=20), SCALED.TWO)
+        self.assertEqual(SCALED.members.filter(value=2), [])
+
+    def test_property_field(self):
+        class SHADOWED(StaticModel):
+            _field_names = 'id', 'name'
+            ONE = 1, 'x'
+
+            @property
+            def name(self):
+                return 'prop'
+
+        self.assertEqual(SHADOWED.members.all().values_list(), [(1, 'prop')])
+        self.assertEqual(SHADOWED.members.all().values(), [{'id': 1, 'name': 'prop'}])
+        self.assertEqual(SHADOWED.members.filter(name='prop'), [SHADOWED.ONE])
+        self.assertEqual(SHADOWED.members.filter(name='x'), [])
+
+    def test_filter_cache_bounded(self):
+        for i in range(1000):
+            PERSON.members.get(_return_none=True, name=f'nobody {i}')
+        self.assertNotIn(frozenset({('name', 'nobody 0')}), PERSON._filter_cache)
+
+        class NUMBER(StaticModel):
+            _field_names = 'id',
+
+        for i in range(1000):
+            setattr(NUMBER, f'N{i}', (i,))
+        for i in range(1000):
+            self.assertIs(NUMBER.members.get(id=i), getattr(NUMBER, f'N{i}'))
+        self.assertLessEqual(len(NUMBER._filter_cache), 256)
+        self.assertIn(frozenset({('id', 999)}), NUMBER._filter_cache)
+
+        for i in range(1000):
+            self.assertEqual(NUMBER.members.choices(id=i), [(i, i)])
+            self.assertEqual(NUMBER.members.choices(id=-i - 1), [])
+        self.assertLessEqual(len(NUMBER._choices_cache), 256)
+        self.assertIn(((), (('id', 999),)), NUMBER._choices_cache)
+        self.assertNotIn(((), (('id', -1000),)), NUMBER._choices_cache)
+
+    def test_model_released(self):
+        class TEMPORARY(StaticModel):
+            _field_names = 'id', 'name'
+            ONE = 1, 'One'
+
+        TEMPORARY.members.all().values_list()
+        TEMPORARY.members.all().values('name')
+        TEMPORARY.members.choices()
+        model = weakref.ref(TEMPORARY)
+        del TEMPORARY
+        gc.collect()
+        self.assertIsNone(model())
+
+    def test_filter_reordered_submodel_fields(self):
+        class PAIR(StaticModel):
+            _field_names = 'a', 'b'
+            X = 1, 2
+
+        class REVERSED(PAIR):
+            _field_names = 'b', 'a'
+            Y = 3, 4
+
+        self.assertIs(PAIR.members.get(a=4), REVERSED.Y)
+        self.assertIs(PAIR.members.get(b=3), REVERSED.Y)
+        self.assertIs(REVERSED.members.get(a=4), REVERSED.Y)
+        self.assertIsNone(PAIR.members.get(a=3, _return_none=True))
+
+    def test_field_names_from_mixin(self):
+        class FieldNames:
+            _field_names = 'code', 'name'
+
+        class LANGUAGE(FieldNames, StaticModel):
+            EN = 'en', 'English'
+            FR = 'fr', 'French'
+
+        self.assertEqual(LANGUAGE.members.all().values_list(), [
+            ('en', 'English'), ('fr', 'French')])
+        self.assertEqual(LANGUAGE.members.all().values('name'), [
+            {'name': 'English'}, {'name': 'French'}])
+        self.assertEqual(LANGUAGE.members.choices(), [('en', 'English'), ('fr', 'French')])
+        with self.assertRaises(LANGUAGE.InvalidField):
+            LANGUAGE.members.filter(bogus=1)
+
+    def test_field_names_assigned(self):
+        class CURRENCY(StaticModel):
+            pass
+
+        CURRENCY._field_names = 'code', 'name'
+        CURRENCY.EUR = 'eur', 'Euro'
+        self.assertEqual(CURRENCY.members.all().values_list(), [('eur', 'Euro')])
+        self.assertEqual(CURRENCY.members.choices(), [('eur', 'Euro')])
+        self.assertIs(CURRENCY.members.get(name='Euro'), CURRENCY.EUR)
+
+        CURRENCY._field_names = 'name', 'code'
+        self.assertEqual(CURRENCY.members.all().values_list(), [('Euro', 'eur')])
+        self.assertEqual(CURRENCY.members.all().values(), [{'name': 'Euro', 'code': 'eur'}])
+        self.assertIs(CURRENCY.members.get(name='Euro'), CURRENCY.EUR)
+        with self.assertRaises(CURRENCY.InvalidField):
+            CURRENCY.members.filter(bogus=1)
+
+    def test_builtin_and_slotted_bases(self):
+        class NUMERAL(int, StaticModel):
+            _field_names = 'value', 'name'
+
+            def __new__(cls, value, name):
+                return super().__new__(cls, value)
+
+            def __init__(self, value, name):
+                self.value = value
+                self.name = name
+
+            ONE = 1, 'One'
+            TWO = 2, 'Two'
+
+        self.assertEqual(NUMERAL.ONE + NUMERAL.TWO, 3)
+        self.assertIs(NUMERAL.members.get(name='Two'), NUMERAL.TWO)
+
+        class Slotted:
+            __slots__ = 'slot',
+
+        class SLOTTED(Slotted, StaticModel):
+            _field_names = 'code', 'name'
+            ONE = 'one', 'One'
+
+        self.assertEqual(SLOTTED.members.all().values_list(), [('one', 'One')])
+
+    def test_reassigned_field(self):
+        class LETTER(StaticModel):
+            _field_names = 'a', 'b'
+            X = 1, 'x'
+
+        class VOWEL(LETTER):
+            Y = 2, 'y'
+
+        self.assertEqual(LETTER.members.all().values_list(), [(1, 'x'), (2, 'y')])
+        self.assertIs(LETTER.members.get(b='y'), VOWEL.Y)
+        repr(VOWEL.Y)
+
+        VOWEL.Y.b = 'changed'
+        self.assertEqual(LETTER.members.all().values_list(), [(1, 'x'), (2, 'changed')])
+        self.assertEqual(VOWEL.members.filter(a=2).values_list('b'), [('changed',)])
+        self.assertEqual(VOWEL.members.all().values('b'), [{'b': 'changed'}])
+        self.assertIs(LETTER.members.get(b='changed'), VOWEL.Y)
+        self.assertIsNone(LETTER.members.get(b='y', _return_none=True))
+        self.assertEqual(repr(VOWEL.Y), "<VOWEL.Y: a=2, b='changed'>")
+
+    def test_member_added_while_indexing(self):
+        class GROWING(StaticModel):
+            _field_names = 'a', 'b'
+            X = 1, 'x'
+
+            @property
+            def b(self):
+                if self.a == 1 and 'Y' not in GROWING.__dict__:
+                    GROWING.Y = 2, 'y'
+                return self.__dict__['b']
+
+        self.assertIs(GROWING.members.get(a=1), GROWING.X)
+        self.assertIs(GROWING.members.get(a=2), GROWING.Y)
+        self.assertIs(GROWING.members.get(b='y'), GROWING.Y)
+
+    def test_package_attributes(self):
+        self.assertIn('StaticModel', dir(staticmodel))
+        self.assertIn('__version__', dir(staticmodel))
+        self.assertIs(staticmodel.StaticModel, StaticModel)
+
+    def test_invalid_field_not_cached(self):
+        misses = _make_predicate.cache_info().misses
+        for i in range(10):
+            with self.assertRaises(PLACE.InvalidField):
+                PLACE.members.filter(**{f'bogus_{i}': i})
+        self.assertEqual(_make_predicate.cache_info().misses, misses)